@@ -3,7 +3,11 @@ from yurenizer.normalizer import SynonymNormalizer
 from copy import deepcopy
 
 from yurenizer.entities import (
+    FLG_ALIAS,
+    Alias,
     Expansion,
+    FlgInput,
+    WordForm,
     OtherLanguage,
     Alphabet,
     NonAlphabeticAbbreviation,
@@ -13,7 +17,7 @@ from yurenizer.entities import (
     UnifyLevel,
 )
 
-from yurenizer.loaders import load_sudachi_synonyms
+from yurenizer.loaders import load_custom_synonyms, load_sudachi_synonyms
 
 
 class TestSynonymNormalizer:
@@ -188,6 +192,22 @@ class TestSynonymNormalizer:
         result = normalizer.normalize(text, test_flags)
         assert result == "アメリカ"
 
+    def test_normalize_iter(self, normalizer):
+        text = "パソコンを使う。USAでチェックを行う。"
+        result = list(normalizer.normalize_iter(text))
+        assert len(result) > 1
+        assert "".join(result) == normalizer.normalize(text)
+
+    def test_normalize_batch(self, normalizer):
+        texts = ["パソコンを使う。", "USAでチェックを行う。", "America"]
+        result = normalizer.normalize_batch(texts)
+        assert result == [normalizer.normalize(text) for text in texts]
+
+    def test_normalize_batch_with_processes(self, normalizer):
+        texts = ["パソコンを使う。", "USAでチェックを行う。", "America"]
+        result = normalizer.normalize_batch(texts, max_workers=2, use_processes=True)
+        assert result == [normalizer.normalize(text) for text in texts]
+
     def test_get_morphemes(self, normalizer):
         text = "テストを実行する"
         morphemes = normalizer.get_morphemes(text)
@@ -201,6 +221,21 @@ class TestSynonymNormalizer:
         assert synonym_group is not None
         assert len(synonym_group) > 0
 
+    def test_get_synonym_entry(self, normalizer):
+        text = "USA"
+        morphemes = normalizer.get_morphemes(text)
+        synonym = normalizer.get_synonym_entry(morphemes[0], is_yougen=False, is_taigen=True)
+        assert synonym is not None
+        assert synonym.lemma == "USA"
+        assert synonym in normalizer.get_synonym_group(morphemes[0], is_yougen=False, is_taigen=True)
+
+    def test_flg_input_disabled_flag(self):
+        # 無効にしたフラグは導出される値にも含まれない
+        flg_input = FlgInput(alias=Alias.DISABLE)
+        assert not flg_input.compute_mask() & FLG_ALIAS
+        unifiable_word_forms, _, _ = flg_input.compute_unifiable_values()
+        assert WordForm.ALIAS.value not in unifiable_word_forms
+
     def test_invalid_input(self, normalizer):
         with pytest.raises(Exception):
             normalizer.normalize("")
@@ -277,6 +312,66 @@ class TestSynonymNormalizer:
         result = custom_normalizer.normalize(text, test_flags)
         assert result == "幽遊白書を読む。hunterhunterも読む。"
 
+    def test_normalize_with_custom_prescan(self, default_disabled_flags):
+        custom_file = "yurenizer/data/custom_synonyms.json"
+        custom_normalizer = SynonymNormalizer(
+            synonym_file_path="./yurenizer/data/synonyms.txt", custom_synonyms_file=custom_file
+        )
+        text = "幽☆遊☆白書を読む。ハンターハンターも読む。"
+        test_flags = deepcopy(default_disabled_flags)
+        test_flags.custom_synonym = True
+        result = custom_normalizer.normalize_with_custom_prescan(text, test_flags)
+        assert result == "幽遊白書を読む。hunterhunterも読む。"
+
+    def test_normalize_with_custom_synonym_disabled(self, default_disabled_flags):
+        custom_file = "yurenizer/data/custom_synonyms.json"
+        custom_normalizer = SynonymNormalizer(
+            synonym_file_path="./yurenizer/data/synonyms.txt", custom_synonyms_file=custom_file
+        )
+        text = "幽☆遊☆白書を読む。ハンターハンターも読む。"
+        test_flags = deepcopy(default_disabled_flags)
+        test_flags.custom_synonym = False
+        result = custom_normalizer.normalize(text, test_flags)
+        assert result == text
+
+    def test_normalize_without_taigen_and_yougen(self, normalizer, default_flags):
+        # 体言も用言も対象外なので、同義語展開は行われない
+        text = "パソコンを使う。"
+        test_flags = deepcopy(default_flags)
+        test_flags.taigen = False
+        test_flags.yougen = False
+        test_flags.custom_synonym = False
+        result = normalizer.normalize(text, test_flags)
+        assert result == text
+
+    def test_normalize_with_unicode_normalize(self, normalizer, default_flags):
+        # 半角カタカナはNFKC正規化してから同義語展開される
+        text = "ﾊﾟｿｺﾝ"
+        test_flags = deepcopy(default_flags)
+        test_flags.unicode_normalize = True
+        result = normalizer.normalize(text, test_flags)
+        assert result == "パーソナルコンピューター"
+
+    def test_normalize_custom_synonym_with_unicode_normalize(self, default_disabled_flags, tmp_path):
+        # unicode_normalizeを指定すると、全角で書いたカスタム同義語もNFKC正規化して照合される
+        custom_file = tmp_path / "custom_synonyms.json"
+        custom_file.write_text('{"幽遊白書": ["ＹＹＨ"]}', encoding="utf-8")
+        custom_normalizer = SynonymNormalizer(
+            synonym_file_path="./yurenizer/data/synonyms.txt", custom_synonyms_file=str(custom_file)
+        )
+        test_flags = deepcopy(default_disabled_flags)
+        test_flags.custom_synonym = True
+        test_flags.unicode_normalize = True
+        assert custom_normalizer.normalize("ＹＹＨ", test_flags) == "幽遊白書"
+        assert custom_normalizer.normalize_with_custom_prescan("ＹＹＨを読む", test_flags) == "幽遊白書を読む"
+
+    def test_load_custom_synonyms_padded_csv(self, tmp_path):
+        # 表計算ソフトから書き出したCSVの末尾の空欄は同義語として扱わない
+        custom_file = tmp_path / "custom_synonyms.csv"
+        custom_file.write_text("幽遊白書,幽☆遊☆白書,,\nhunter,ハンター,\n", encoding="utf-8")
+        custom_synonyms = load_custom_synonyms(str(custom_file))
+        assert custom_synonyms == {"幽遊白書": {"幽☆遊☆白書"}, "hunter": {"ハンター"}}
+
     def test_load_sudachi_synonyms_file_not_found(self):
         with pytest.raises(FileNotFoundError):
             load_sudachi_synonyms("non_existent_file.txt")
@@ -18,7 +18,7 @@ class CsvSynonymNormalizer(SynonymNormalizer):
         self,
         input_file_path: str,
         output_file_path: str,
-        config: NormalizerConfig = NormalizerConfig(),
+        config: Optional[NormalizerConfig] = None,
     ) -> None:
         with open(input_file_path, "r") as f, open(output_file_path, "w") as w:
             reader = csv.reader(f)
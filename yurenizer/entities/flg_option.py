@@ -1,7 +1,9 @@
 # Definition of flag options（フラグオプションの定義）
 
-from dataclasses import dataclass
 from enum import Enum
+from typing import FrozenSet, NamedTuple, Tuple
+
+from .synonym import Abbreviation, SpellingInconsistency, WordForm
 
 
 class UnifyLevel(Enum):
@@ -146,8 +148,30 @@ class CusotomSynonym(Enum):
         return cls(value)
 
 
-@dataclass
-class FlgInput:
+# Bits of FlgInput.compute_mask(), set when the corresponding normalization is enabled
+# （FlgInput.compute_mask()のビット。対応する正規化が有効な場合に立つ）
+FLG_OTHER_LANGUAGE = 1 << 0
+FLG_ALIAS = 1 << 1
+FLG_OLD_NAME = 1 << 2
+FLG_MISUSE = 1 << 3
+FLG_ALPHABETIC_ABBREVIATION = 1 << 4
+FLG_NON_ALPHABETIC_ABBREVIATION = 1 << 5
+FLG_ALPHABET = 1 << 6
+FLG_ORTHOGRAPHIC_VARIATION = 1 << 7
+FLG_MISSPELLING = 1 << 8
+FLG_CUSTOM_SYNONYM = 1 << 9
+
+# Groups of bits tested together（まとめて判定するビットの組）
+# Lexical normalization（語彙素の正規化）
+MASK_LEXEME = FLG_OTHER_LANGUAGE | FLG_ALIAS | FLG_OLD_NAME | FLG_MISUSE
+# Abbreviation normalization（略語の正規化）
+MASK_ABBREVIATION = FLG_ALPHABETIC_ABBREVIATION | FLG_NON_ALPHABETIC_ABBREVIATION
+# Spelling inconsistency normalization（表記揺れの正規化）
+MASK_SPELLING_INCONSISTENCY = FLG_ALPHABET | FLG_ORTHOGRAPHIC_VARIATION | FLG_MISSPELLING
+
+
+class FlgInput(NamedTuple):
+    # Immutable so that the instance cached per config can be shared（設定ごとにキャッシュしたインスタンスを共有できるよう不変）
     taigen: Taigen = Taigen.INCLUDE
     yougen: Yougen = Yougen.EXCLUDE
     expansion: Expansion = Expansion.FROM_ANOTHER
@@ -162,3 +186,54 @@ class FlgInput:
     orthographic_variation: OrthographicVariation = OrthographicVariation.ENABLE
     misspelling: Misspelling = Misspelling.ENABLE
     custom_synonym: CusotomSynonym = CusotomSynonym.ENABLE
+    # Whether the text is NFKC-normalized, so that custom synonyms are matched NFKC-normalized too
+    # （テキストをNFKC正規化するかどうか。カスタム同義語もNFKC正規化して照合する）
+    unicode_normalize: bool = False
+
+    def compute_mask(self) -> int:
+        # Encode the enabled flags as FLG_* bits（有効なフラグをFLG_*ビットに変換）
+        mask = 0
+        for flg, enable, bit in (
+            (self.other_language, OtherLanguage.ENABLE, FLG_OTHER_LANGUAGE),
+            (self.alias, Alias.ENABLE, FLG_ALIAS),
+            (self.old_name, OldName.ENABLE, FLG_OLD_NAME),
+            (self.misuse, Misuse.ENABLE, FLG_MISUSE),
+            (self.alphabetic_abbreviation, AlphabeticAbbreviation.ENABLE, FLG_ALPHABETIC_ABBREVIATION),
+            (self.non_alphabetic_abbreviation, NonAlphabeticAbbreviation.ENABLE, FLG_NON_ALPHABETIC_ABBREVIATION),
+            (self.alphabet, Alphabet.ENABLE, FLG_ALPHABET),
+            (self.orthographic_variation, OrthographicVariation.ENABLE, FLG_ORTHOGRAPHIC_VARIATION),
+            (self.misspelling, Misspelling.ENABLE, FLG_MISSPELLING),
+            (self.custom_synonym, CusotomSynonym.ENABLE, FLG_CUSTOM_SYNONYM),
+        ):
+            if flg == enable:
+                mask |= bit
+        return mask
+
+    def compute_unifiable_values(self) -> Tuple[FrozenSet[int], FrozenSet[int], FrozenSet[int]]:
+        # Collect the word form, abbreviation and spelling inconsistency values enabled by the flags
+        # （フラグで有効になっている語形・略語・表記揺れの値を集める）
+        word_forms = {WordForm.REPRESENTATIVE.value}
+        for flg, enable, word_form in (
+            (self.other_language, OtherLanguage.ENABLE, WordForm.TRANSLATION),
+            (self.alias, Alias.ENABLE, WordForm.ALIAS),
+            (self.old_name, OldName.ENABLE, WordForm.OLD_NAME),
+            (self.misuse, Misuse.ENABLE, WordForm.MISUSE),
+        ):
+            if flg == enable:
+                word_forms.add(word_form.value)
+        abbreviations = {Abbreviation.REPRESENTATIVE.value}
+        for flg, enable, abbreviation in (
+            (self.alphabetic_abbreviation, AlphabeticAbbreviation.ENABLE, Abbreviation.ALPHABET),
+            (self.non_alphabetic_abbreviation, NonAlphabeticAbbreviation.ENABLE, Abbreviation.NOT_ALPHABET),
+        ):
+            if flg == enable:
+                abbreviations.add(abbreviation.value)
+        spelling_inconsistencies = {SpellingInconsistency.REPRESENTATIVE.value}
+        for flg, enable, spelling_inconsistency in (
+            (self.alphabet, Alphabet.ENABLE, SpellingInconsistency.ALPHABET),
+            (self.orthographic_variation, OrthographicVariation.ENABLE, SpellingInconsistency.ORTHOGRAPHIC_VARIATION),
+            (self.misspelling, Misspelling.ENABLE, SpellingInconsistency.MISSPELLING),
+        ):
+            if flg == enable:
+                spelling_inconsistencies.add(spelling_inconsistency.value)
+        return frozenset(word_forms), frozenset(abbreviations), frozenset(spelling_inconsistencies)
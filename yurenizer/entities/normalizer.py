@@ -17,6 +17,7 @@ class NormalizerConfig:
     orthographic_variation: bool = True
     misspelling: bool = True
     custom_synonym: bool = True
+    unicode_normalize: bool = False
 
     """
     NormalizerConfig class is a class that holds normalization settings.
@@ -38,6 +39,7 @@ class NormalizerConfig:
         orthographic_variation（default=True）: A flag indicating whether to normalize orthographic variations. The default is to normalize. If you do not normalize, specify False.
         missspelling（default=True）: A flag indicating whether to normalize misspellings. The default is to normalize. If you do not normalize, specify False.
         custom_synonym（default=True）: A flag indicating whether to use custom_synonyms set by the user. The default is to use. If you do not use, specify False.
+        unicode_normalize（default=False）: A flag indicating whether to apply NFKC normalization to the input text before tokenization, which unifies width variants such as half-width katakana. Custom synonyms are then matched after NFKC normalization as well. The default is not to apply. If you apply, specify True.
 
     Examples:
         ```
@@ -71,5 +73,6 @@ class NormalizerConfig:
         orthographic_variation（default=True）: 異表記を正規化するかどうかのフラグ。デフォルトは正規化する。正規化しない場合はFalseを指定。
         missspelling（default=True）: 誤表記を正規化するかどうかのフラグ。デフォルトは正規化する。正規化しない場合はFalseを指定。
         custom_synonym（default=True）: ユーザーが設定したcustom_synonymを使用するかどうかのフラグ。デフォルトは使用する。使用しない場合はFalseを指定。
+        unicode_normalize（default=False）: 形態素解析の前に入力テキストをNFKC正規化し、半角カタカナなどの幅の違いを統一するかどうかのフラグ。カスタム同義語もNFKC正規化して照合する。デフォルトは正規化しない。正規化する場合はTrueを指定。
 
     """
@@ -54,7 +54,7 @@ class SynonymField(Enum):
         return self.value
 
 
-@dataclass
+@dataclass(slots=True)
 class Synonym:
     taigen_or_yougen: TaigenOrYougen
     flg_expansion: FlgExpantion
@@ -1,5 +1,6 @@
 import csv
 import json
+import sys
 from collections import defaultdict
 from typing import Dict, List, Set
 
@@ -14,28 +15,32 @@ def load_sudachi_synonyms(synonym_file: str) -> Dict[str, List[Synonym]]:
         synonym_file: Path to the SudachiDict synonym file
 
     Returns:
-        Synonym information dictionary
+        Synonym information dictionary keyed by the synonym group ID as written in the file (e.g. "000001")
     """
     try:
-        with open(synonym_file, "r", encoding="utf-8") as f:
-            reader = csv.reader(f)
-            data = [row for row in reader if row]
-
         synonyms = defaultdict(list)
-        for line in data:
-            synonyms[line[0]].append(
-                Synonym(
-                    taigen_or_yougen=int(line[1]),  # Taigen or Yougen
-                    flg_expansion=int(line[2]),  # Expansion control flag
-                    lexeme_id=int(line[3].split("/")[0]),  # Lexeme number within the group
-                    word_form=int(line[4]),  # Word form type within the same lexeme
-                    abbreviation=int(line[5]),  # Abbreviation
-                    spelling_inconsistency=int(line[6]),  # Spelling inconsistency information
-                    field=line[7],  # Field information
-                    lemma=line[8],  # Lemma
+        with open(synonym_file, "r", encoding="utf-8") as f:
+            # Stream rows straight into the groups instead of materializing the whole file first
+            for raw_line in f:
+                raw_line = raw_line.rstrip("\r\n")
+                # synonyms.txt has no quoted fields, so a plain split is enough; csv is only needed for quoted rows
+                line = raw_line.split(",") if '"' not in raw_line else next(csv.reader([raw_line]))
+                if len(line) < 9:
+                    # Skip blank lines separating the synonym groups
+                    continue
+                synonyms[line[0]].append(
+                    Synonym(
+                        taigen_or_yougen=int(line[1]),  # Taigen or Yougen
+                        flg_expansion=int(line[2]),  # Expansion control flag
+                        lexeme_id=int(line[3].split("/")[0]),  # Lexeme number within the group
+                        word_form=int(line[4]),  # Word form type within the same lexeme
+                        abbreviation=int(line[5]),  # Abbreviation
+                        spelling_inconsistency=int(line[6]),  # Spelling inconsistency information
+                        field=sys.intern(line[7]),  # Field information
+                        lemma=sys.intern(line[8]),  # Lemma
+                    )
                 )
-            )
-        return synonyms
+        return dict(synonyms)
     except FileNotFoundError as e:
         raise FileNotFoundError(f"Failed to load Sudachi synonyms: {e}")
     except ValueError as e:
@@ -57,10 +62,13 @@ def load_custom_synonyms(file_path: str) -> Dict[str, Set[str]]:
             if file_path.endswith((".csv", ".tsv")):
                 delimiter = "," if file_path.endswith(".csv") else "\t"
                 reader = csv.reader(f, delimiter=delimiter)
-                custom_synonyms = {row[0]: set(row[1:]) for row in reader}
+                # Spreadsheet exports pad short rows with trailing delimiters, so skip the empty cells
+                custom_synonyms = {sys.intern(row[0]): {sys.intern(w) for w in row[1:] if w} for row in reader if row}
             elif file_path.endswith(".json"):
                 custom_synonyms = json.load(f)
-                custom_synonyms = {k: set(v) for k, v in custom_synonyms.items() if v}
+                custom_synonyms = {
+                    sys.intern(k): {sys.intern(w) for w in v if w} for k, v in custom_synonyms.items() if v
+                }
             else:
                 raise ValueError("Invalid file format. Please use JSON or CSV.")
     except Exception as e:
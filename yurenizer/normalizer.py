@@ -1,16 +1,27 @@
-from typing import Dict, List, Optional, Set, Union
+import os
+import threading
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import fields
+from functools import lru_cache
+from itertools import repeat
+from operator import attrgetter
+from typing import Dict, FrozenSet, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
 
 from sudachipy import dictionary, tokenizer
 from sudachipy.morpheme import Morpheme
+from sudachipy.morphemelist import MorphemeList
 
 from .entities import (
-    Abbreviation,
     Alias,
     Alphabet,
     AlphabeticAbbreviation,
     CusotomSynonym,
     Expansion,
     FlgExpantion,
+    MASK_ABBREVIATION,
+    MASK_LEXEME,
+    MASK_SPELLING_INCONSISTENCY,
     FlgInput,
     Misspelling,
     Misuse,
@@ -26,13 +37,62 @@ from .entities import (
     Taigen,
     TaigenOrYougen,
     UnifyLevel,
-    WordForm,
     Yougen,
 )
 from .loaders import load_custom_synonyms, load_sudachi_synonyms
 
+# Extract the field values of NormalizerConfig as a hashable tuple (in field order)
+_config_values = attrgetter(*(field.name for field in fields(NormalizerConfig)))
+
+# Enum members and values compared for every morpheme, bound once at import time
+_CUSTOM_SYNONYM_ENABLE = CusotomSynonym.ENABLE
+_TAIGEN_INCLUDE = Taigen.INCLUDE
+_YOUGEN_INCLUDE = Yougen.INCLUDE
+_EXPANSION_ANY = Expansion.ANY
+_EXPANSION_FROM_ANOTHER = Expansion.FROM_ANOTHER
+_FLG_EXPANSION_ANY = FlgExpantion.ANY.value
+_FLG_EXPANSION_ANY_OR_FROM_ANOTHER = (FlgExpantion.ANY.value, FlgExpantion.FROM_ANOTHER.value)
+_TAIGEN_VALUE = TaigenOrYougen.TAIGEN.value
+_YOUGEN_VALUE = TaigenOrYougen.YOUGEN.value
+_UNIFY_LEVEL_LEXEME = UnifyLevel.LEXEME
+_UNIFY_LEVEL_ABBREVIATION = UnifyLevel.ABBREVIATION
+
+# Key of a custom synonym trie node holding the representative word of the custom synonym ending there
+_TRIE_END = None
+
+# Maximum number of normalized words memoized per normalization flags, and of flags with a memo
+_WORD_CACHE_MAX_SIZE = 100_000
+_WORD_CACHE_MAX_FLAGS = 128
+
+
+class _DerivedFlags(NamedTuple):
+    # Values derived from a FlgInput once per text and read for every morpheme
+    mask: int  # Bitmask of the enabled FLG_* flags
+    unifiable_word_forms: FrozenSet[int]  # Word form values that can be unified into the representative
+    unifiable_abbreviations: FrozenSet[int]  # Abbreviation values that can be unified into the representative
+    # Spelling inconsistency values that can be unified into the representative
+    unifiable_spelling_inconsistencies: FrozenSet[int]
+
+
+@lru_cache(maxsize=_WORD_CACHE_MAX_FLAGS)
+def _derive_flags(flg_input: FlgInput) -> _DerivedFlags:
+    """
+    Derive the values read by the normalization of each morpheme from the flags.
+
+    Args:
+        flg_input: Normalization flags
+
+    Returns:
+        Values derived from the flags
+    """
+    return _DerivedFlags(flg_input.compute_mask(), *flg_input.compute_unifiable_values())
+
 
 class SynonymNormalizer:
+    # Sudachi dictionaries shared by all instances, keyed by SudachiDict type, since each one is large to load
+    _sudachi_dictionaries: Dict[str, dictionary.Dictionary] = {}
+    _sudachi_dictionaries_lock = threading.Lock()
+
     def __init__(
         self,
         synonym_file_path: str,
@@ -47,44 +107,222 @@ class SynonymNormalizer:
             sudachi_dict: SudachiDict type (default: full)
             custom_synonyms_file: Path to the custom synonym definition file
         """
-        # Initialize Sudachi
-        sudachi_dic = dictionary.Dictionary(dict=sudachi_dict)
-        self.tokenizer_obj = sudachi_dic.create()
+        # Constructor arguments, from which worker processes of normalize_batch build their own normalizer
+        self._init_args = (synonym_file_path, sudachi_dict, custom_synonyms_file)
+
+        # Sudachi is initialized on first use, so that constructing a normalizer does not load the Sudachi dictionary
+        self._sudachi_dict = sudachi_dict
+        self._sudachi_dic: Optional[dictionary.Dictionary] = None
+        self._sudachi_lock = threading.Lock()
+        # A Sudachi tokenizer cannot be shared across threads, so each thread creates its own
+        self._thread_local = threading.local()
         self.mode = tokenizer.Tokenizer.SplitMode.C
 
-        # Part-of-speech matching
-        self.taigen_matcher = sudachi_dic.pos_matcher(lambda x: x[0] == "名詞")
-        self.yougen_matcher = sudachi_dic.pos_matcher(lambda x: x[0] in ["動詞", "形容詞"])
-
         # Load synonyms from SudachiDict's synonym file
         synonyms = load_sudachi_synonyms(synonym_file_path)
         self.synonyms = {int(k): v for k, v in synonyms.items()}
+        # Groups never change after loading, so split them into taigen / yougen views once
+        self.taigen_synonyms: Dict[int, List[Synonym]] = {
+            group_id: [s for s in group if s.taigen_or_yougen == _TAIGEN_VALUE]
+            for group_id, group in self.synonyms.items()
+        }
+        self.yougen_synonyms: Dict[int, List[Synonym]] = {
+            group_id: [s for s in group if s.taigen_or_yougen == _YOUGEN_VALUE]
+            for group_id, group in self.synonyms.items()
+        }
+        # Lemma indices of the taigen / yougen views, so that a morpheme's entry is found with a single dict lookup
+        self._taigen_lemma_indices: Dict[int, Dict[str, Synonym]] = {
+            group_id: self._build_lemma_index(group) for group_id, group in self.taigen_synonyms.items()
+        }
+        self._yougen_lemma_indices: Dict[int, Dict[str, Synonym]] = {
+            group_id: self._build_lemma_index(group) for group_id, group in self.yougen_synonyms.items()
+        }
+        # Representative lemma of each part of the taigen / yougen views sharing a lexeme id, word form and
+        # abbreviation, which the narrowing stages look up instead of filtering the group per morpheme
+        self._taigen_representatives: Dict[int, Dict[Tuple[int, ...], str]] = {
+            group_id: self._build_representative_lemmas(group) for group_id, group in self.taigen_synonyms.items()
+        }
+        self._yougen_representatives: Dict[int, Dict[Tuple[int, ...], str]] = {
+            group_id: self._build_representative_lemmas(group) for group_id, group in self.yougen_synonyms.items()
+        }
 
         # Load custom synonyms
         self.custom_synonyms: Dict[str, Set[str]] = {}
         if custom_synonyms_file:
             self.custom_synonyms = load_custom_synonyms(custom_synonyms_file)
+        # Reverse index from each custom synonym to its representative word
+        self._custom_synonym_index: Dict[str, str] = {}
+        for representative, words in self.custom_synonyms.items():
+            for word in words:
+                # If a word is listed under several representatives, the first one wins
+                self._custom_synonym_index.setdefault(word, representative)
+        # The same index for NFKC-normalized text, whose custom synonyms are NFKC-normalized as well
+        self._nfkc_custom_synonym_index: Dict[str, str] = {}
+        for word, representative in self._custom_synonym_index.items():
+            self._nfkc_custom_synonym_index.setdefault(unicodedata.normalize("NFKC", word), representative)
+        # Character tries of the custom synonyms keyed by unicode_normalize, built on first use by
+        # normalize_with_custom_prescan
+        self._custom_synonym_tries: Dict[bool, Dict] = {}
+
+        # Normalized words memoized per normalization flags, keyed by (surface, word id, part-of-speech id)
+        self._word_caches: Dict[FlgInput, Dict[Tuple[str, int, int], str]] = {}
+
+        # Flags for the default configuration, prepared once and reused by every normalize() call without a config
+        self._default_flg_input = self._prepare_normalization_flags(NormalizerConfig())
 
     def normalize(
         self,
         text: str,
-        config: NormalizerConfig = NormalizerConfig(),
+        config: Optional[NormalizerConfig] = None,
     ) -> str:
         """
         Normalize text by unifying spelling variations and synonyms.
 
         Args:
             text: Text to normalize
-            config: Normalization options
+            config: Normalization options (default: NormalizerConfig())
+
+        Returns:
+            Normalized text
+        """
+        # Convert config to FlgInput with hierarchical conditions
+        if config is None:
+            return self._normalize_with_flags(text, self._default_flg_input)
+        return self._normalize_with_flags(text, self._prepare_normalization_flags(config))
+
+    def normalize_iter(
+        self,
+        text: str,
+        config: Optional[NormalizerConfig] = None,
+    ) -> Iterator[str]:
+        """
+        Normalize text one morpheme at a time, so that long texts can be written out without building the whole result.
+
+        Args:
+            text: Text to normalize
+            config: Normalization options (default: NormalizerConfig())
+
+        Returns:
+            Iterator over the normalized words, which join into the result of normalize()
+        """
+        flg_input = self._default_flg_input if config is None else self._prepare_normalization_flags(config)
+        # Validate eagerly, so that an empty text fails here rather than on the first next()
+        text = self._prepare_text(text, flg_input.unicode_normalize)
+        if not self._should_normalize(flg_input):
+            return iter((text,))
+        return self._iter_normalized_words(text, flg_input)
+
+    def normalize_with_custom_prescan(
+        self,
+        text: str,
+        config: Optional[NormalizerConfig] = None,
+    ) -> str:
+        """
+        Normalize text, replacing custom synonyms in a single scan of the whole text first.
+
+        Unlike normalize, custom synonyms are matched as substrings rather than as whole morphemes, preferring the
+        longest one at each position. This also catches custom synonyms that Sudachi splits into several morphemes.
+        Only the text between the matches is tokenized and normalized with the Sudachi synonym dictionary.
+        The scan walks a character trie of the custom synonyms, so its cost depends on the length of the text and of
+        the matched prefixes, not on the number of custom synonyms.
+
+        Args:
+            text: Text to normalize
+            config: Normalization options (default: NormalizerConfig())
 
         Returns:
             Normalized text
         """
         if not text:
             raise ValueError("Input text is empty.")
+        if config is None:
+            config = NormalizerConfig()
+        if not config.custom_synonym or not self._custom_synonym_index:
+            return self.normalize(text, config)
+        unicode_normalize = bool(config.unicode_normalize)
+        if unicode_normalize:
+            text = unicodedata.normalize("NFKC", text)
+        # Match the custom synonyms in the same normalization form as the text
+        trie = self._custom_synonym_tries.get(unicode_normalize)
+        if trie is None:
+            trie = self._custom_synonym_tries[unicode_normalize] = self._build_custom_synonym_trie(
+                self._get_custom_synonym_index(unicode_normalize)
+            )
+
+        parts = []
+        position = 0
+        start = 0
+        text_length = len(text)
+        while start < text_length:
+            # Walk the trie from this position, remembering the end of the longest custom synonym passed
+            node = trie
+            end = 0
+            representative = None
+            index = start
+            while index < text_length:
+                node = node.get(text[index])
+                if node is None:
+                    break
+                index += 1
+                if _TRIE_END in node:
+                    end = index
+                    representative = node[_TRIE_END]
+            if not end:
+                start += 1
+                continue
+            if start > position:
+                parts.append(self.normalize(text[position:start], config))
+            parts.append(representative)
+            position = start = end
+        if position < text_length:
+            parts.append(self.normalize(text[position:], config))
+        return "".join(parts)
+
+    def normalize_batch(
+        self,
+        texts: List[str],
+        config: Optional[NormalizerConfig] = None,
+        max_workers: Optional[int] = None,
+        use_processes: bool = False,
+    ) -> List[str]:
+        """
+        Normalize multiple texts in parallel threads or processes.
 
-        # Convert config to FlgInput with hierarchical conditions
-        flg_input = self._prepare_normalization_flags(config)
+        Args:
+            texts: Texts to normalize
+            config: Normalization options (default: NormalizerConfig())
+            max_workers: Maximum number of threads or processes (default: based on the CPU count)
+            use_processes: Whether to normalize in worker processes, each loading its own normalizer, instead of threads.
+                This can use several CPU cores for large batches, at the cost of loading the dictionaries per process.
+
+        Returns:
+            Normalized texts in the same order as the input
+        """
+        if use_processes:
+            texts = list(texts)
+            chunksize = max(1, len(texts) // ((max_workers or os.cpu_count() or 1) * 4))
+            with ProcessPoolExecutor(
+                max_workers=max_workers, initializer=_init_process_normalizer, initargs=self._init_args
+            ) as executor:
+                return list(executor.map(_normalize_in_process, texts, repeat(config), chunksize=chunksize))
+
+        # Prepare the flags once for the whole batch, so that every text also shares the same word memo
+        flg_input = self._default_flg_input if config is None else self._prepare_normalization_flags(config)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda text: self._normalize_with_flags(text, flg_input), texts))
+
+    def _normalize_with_flags(self, text: str, flg_input: FlgInput) -> str:
+        """
+        Normalize text with prepared flags.
+
+        Args:
+            text: Text to normalize
+            flg_input: Normalization flags
+
+        Returns:
+            Normalized text
+        """
+        text = self._prepare_text(text, flg_input.unicode_normalize)
 
         # If all flags are disabled, return the original text
         if not self._should_normalize(flg_input):
@@ -92,6 +330,24 @@ class SynonymNormalizer:
 
         return self._normalize_text(text, flg_input)
 
+    def _prepare_text(self, text: str, unicode_normalize: bool) -> str:
+        """
+        Validate the input text and apply NFKC normalization if requested.
+
+        Args:
+            text: Text to normalize
+            unicode_normalize: Whether to apply NFKC normalization to the text
+
+        Returns:
+            Text to tokenize
+        """
+        if not text:
+            raise ValueError("Input text is empty.")
+        # Unify width variants such as half-width katakana before tokenization
+        if unicode_normalize:
+            text = unicodedata.normalize("NFKC", text)
+        return text
+
     def _prepare_normalization_flags(self, config: NormalizerConfig) -> FlgInput:
         """
         Prepare normalization flags with hierarchical conditions.
@@ -102,42 +358,68 @@ class SynonymNormalizer:
         Returns:
             Prepared FlgInput with hierarchical flags
         """
-        flg_input = FlgInput(
-            taigen=Taigen.from_int(config.taigen),
-            yougen=Yougen.from_int(config.yougen),
-            expansion=Expansion.from_str(config.expansion),
-            unify_level=UnifyLevel.from_str(config.unify_level),
-            other_language=OtherLanguage.from_int(config.other_language),
-            alias=Alias.from_int(config.alias),
-            old_name=OldName.from_int(config.old_name),
-            misuse=Misuse.from_int(config.misuse),
-            alphabetic_abbreviation=AlphabeticAbbreviation.from_int(config.alphabetic_abbreviation),
-            non_alphabetic_abbreviation=NonAlphabeticAbbreviation.from_int(config.non_alphabetic_abbreviation),
-            alphabet=Alphabet.from_int(config.alphabet),
-            orthographic_variation=OrthographicVariation.from_int(config.orthographic_variation),
-            misspelling=Misspelling.from_int(config.misspelling),
-            custom_synonym=CusotomSynonym.from_int(config.custom_synonym),
-        )
+        # Configs are mutable, so cache by their field values rather than by identity
+        return self._build_normalization_flags(_config_values(config))
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _build_normalization_flags(config_values: Tuple) -> FlgInput:
+        """
+        Build normalization flags with hierarchical conditions from NormalizerConfig field values.
+
+        Args:
+            config_values: Field values of NormalizerConfig in field order
+
+        Returns:
+            Prepared FlgInput with hierarchical flags
+        """
+        config = NormalizerConfig(*config_values)
+        other_language = OtherLanguage.from_int(config.other_language)
+        alias = Alias.from_int(config.alias)
+        old_name = OldName.from_int(config.old_name)
+        misuse = Misuse.from_int(config.misuse)
+        alphabetic_abbreviation = AlphabeticAbbreviation.from_int(config.alphabetic_abbreviation)
+        non_alphabetic_abbreviation = NonAlphabeticAbbreviation.from_int(config.non_alphabetic_abbreviation)
+        alphabet = Alphabet.from_int(config.alphabet)
+        orthographic_variation = OrthographicVariation.from_int(config.orthographic_variation)
+        misspelling = Misspelling.from_int(config.misspelling)
 
         # Hierarchical flag settings
         if (
-            flg_input.alphabet == Alphabet.ENABLE
-            or flg_input.orthographic_variation == OrthographicVariation.ENABLE
-            or flg_input.misspelling == Misspelling.ENABLE
+            alphabet == Alphabet.ENABLE
+            or orthographic_variation == OrthographicVariation.ENABLE
+            or misspelling == Misspelling.ENABLE
         ):
-            flg_input.alphabetic_abbreviation = AlphabeticAbbreviation.ENABLE
-            flg_input.non_alphabetic_abbreviation = NonAlphabeticAbbreviation.ENABLE
+            alphabetic_abbreviation = AlphabeticAbbreviation.ENABLE
+            non_alphabetic_abbreviation = NonAlphabeticAbbreviation.ENABLE
 
         if (
-            flg_input.alphabetic_abbreviation == AlphabeticAbbreviation.ENABLE
-            or flg_input.non_alphabetic_abbreviation == NonAlphabeticAbbreviation.ENABLE
+            alphabetic_abbreviation == AlphabeticAbbreviation.ENABLE
+            or non_alphabetic_abbreviation == NonAlphabeticAbbreviation.ENABLE
         ):
-            flg_input.other_language = OtherLanguage.ENABLE
-            flg_input.alias = Alias.ENABLE
-            flg_input.old_name = OldName.ENABLE
-            flg_input.misuse = Misuse.ENABLE
-
-        return flg_input
+            other_language = OtherLanguage.ENABLE
+            alias = Alias.ENABLE
+            old_name = OldName.ENABLE
+            misuse = Misuse.ENABLE
+
+        # Construct positionally in FlgInput field order
+        return FlgInput(
+            Taigen.from_int(config.taigen),
+            Yougen.from_int(config.yougen),
+            Expansion.from_str(config.expansion),
+            UnifyLevel.from_str(config.unify_level),
+            other_language,
+            alias,
+            old_name,
+            misuse,
+            alphabetic_abbreviation,
+            non_alphabetic_abbreviation,
+            alphabet,
+            orthographic_variation,
+            misspelling,
+            CusotomSynonym.from_int(config.custom_synonym),
+            bool(config.unicode_normalize),
+        )
 
     def _should_normalize(self, flg_input: FlgInput) -> bool:
         """
@@ -149,13 +431,13 @@ class SynonymNormalizer:
         Returns:
             Whether normalization should be performed
         """
-        return not (
-            flg_input.custom_synonym == CusotomSynonym.DISABLE
-            and flg_input.other_language == OtherLanguage.DISABLE
-            and flg_input.alias == Alias.DISABLE
-            and flg_input.old_name == OldName.DISABLE
-            and flg_input.misuse == Misuse.DISABLE
-        )
+        # Custom synonyms can only rewrite the text if any are defined
+        if flg_input.custom_synonym == CusotomSynonym.ENABLE and self._custom_synonym_index:
+            return True
+        # Without target parts of speech, no morpheme can be normalized by the synonym dictionary
+        if flg_input.taigen == Taigen.EXCLUDE and flg_input.yougen == Yougen.EXCLUDE:
+            return False
+        return bool(_derive_flags(flg_input).mask & MASK_LEXEME)
 
     def _normalize_text(self, text: str, flg_input: FlgInput) -> str:
         """
@@ -168,132 +450,139 @@ class SynonymNormalizer:
         Returns:
             Normalized text
         """
-        morphemes = self.get_morphemes(text)
-        normalized_parts = [self._normalize_word(morpheme, flg_input) for morpheme in morphemes]
-        return "".join(normalized_parts)
+        return "".join(self._iter_normalized_words(text, flg_input))
 
-    def _normalize_word(self, morpheme: Morpheme, flg_input: FlgInput) -> str:
+    def _iter_normalized_words(self, text: str, flg_input: FlgInput) -> Iterator[str]:
+        """
+        Internal method to normalize text with given flags, one morpheme at a time.
+
+        Args:
+            text: Text to normalize
+            flg_input: Normalization flags
+
+        Yields:
+            Normalized word of each morpheme
+        """
+        # Iterate the tokenizer output directly and bind the methods used per morpheme to locals
+        normalize_word = self._normalize_word
+        derived_flags = _derive_flags(flg_input)
+        word_cache = self._get_word_cache(flg_input)
+        get_cached_word = word_cache.get
+        for morpheme in self._get_tokenizer().tokenize(text, self.mode):
+            # The same dictionary word with the same surface is always normalized the same way
+            key = (morpheme.surface(), morpheme.word_id(), morpheme.part_of_speech_id())
+            word = get_cached_word(key)
+            if word is None:
+                word = normalize_word(morpheme, flg_input, derived_flags)
+                if len(word_cache) >= _WORD_CACHE_MAX_SIZE:
+                    word_cache.clear()
+                word_cache[key] = word
+            yield word
+
+    def _get_word_cache(self, flg_input: FlgInput) -> Dict[Tuple[str, int, int], str]:
+        """
+        Get the memo of normalized words for the given flags.
+
+        Args:
+            flg_input: Normalization flags
+
+        Returns:
+            Normalized words keyed by (surface, word id, part-of-speech id)
+        """
+        word_cache = self._word_caches.get(flg_input)
+        if word_cache is None:
+            if len(self._word_caches) >= _WORD_CACHE_MAX_FLAGS:
+                self._word_caches.clear()
+            word_cache = self._word_caches.setdefault(flg_input, {})
+        return word_cache
+
+    def _normalize_word(self, morpheme: Morpheme, flg_input: FlgInput, derived_flags: _DerivedFlags) -> str:
         """
         Normalize a word by unifying spelling variations and synonyms（表記揺れと同義語を統一して単語を正規化する）
 
         Args:
             morpheme: Morpheme information（形態素情報）
             flg_input: Normalization options（正規化オプション）
+            derived_flags: Values derived from the normalization options（正規化オプションから導出した値）
 
         Returns:
             Normalized word（正規化された単語）
 
         Example:
-            normalized_word = _normalize_word(morpheme, flg_input)
+            normalized_word = _normalize_word(morpheme, flg_input, _derive_flags(flg_input))
         """
+        # Call the Sudachi accessor once and reuse the result
+        surface = morpheme.surface()
         # Use custom synonym definitions
-        custom_representation = self.get_custom_synonym(morpheme)
-        if custom_representation:
-            return custom_representation
+        if flg_input.custom_synonym is _CUSTOM_SYNONYM_ENABLE:
+            custom_representation = self._normalize_word_by_custom_synonyms(surface, flg_input.unicode_normalize)
+            if custom_representation:
+                return custom_representation
+        mask = derived_flags.mask
         # If all flags are disabled, return the original word
-        if (
-            flg_input.other_language == OtherLanguage.DISABLE
-            and flg_input.alias == Alias.DISABLE
-            and flg_input.old_name == OldName.DISABLE
-            and flg_input.misuse == Misuse.DISABLE
-        ):
-            return morpheme.surface()
-        # Determine whether it's yougen or taigen
-        is_yougen = self.yougen_matcher(morpheme)
-        is_taigen = self.taigen_matcher(morpheme)
-        if flg_input.yougen == Yougen.INCLUDE and is_yougen:
+        if not mask & MASK_LEXEME:
+            return surface
+        # Determine whether it's yougen. The yougen matcher is only called when yougen is included.
+        is_yougen = flg_input.yougen is _YOUGEN_INCLUDE and self._yougen_matcher(morpheme)
+        if is_yougen:
+            # A yougen is looked up by its dictionary form
             morpheme = self.get_morphemes(morpheme.dictionary_form())[0]
-        elif flg_input.taigen == Taigen.INCLUDE and is_taigen:
-            pass
-        else:
-            return morpheme.surface()
-
-        if not is_yougen and True not in [
-            flg_input.other_language.value,
-            flg_input.alias.value,
-            flg_input.old_name.value,
-            flg_input.misuse.value,
-            flg_input.alphabetic_abbreviation.value,
-            flg_input.non_alphabetic_abbreviation.value,
-            flg_input.alphabet.value,
-            flg_input.orthographic_variation.value,
-            flg_input.misspelling.value,
-        ]:
-            return morpheme.surface()
-
-        # Get synonym group for each taigen or yougen
-        synonym_group = self.get_synonym_group(morpheme, is_yougen, is_taigen)
-        if not synonym_group:
-            return morpheme.surface()
+            surface = morpheme.surface()
+        elif flg_input.taigen is not _TAIGEN_INCLUDE:
+            # Only yougen are normalized and this morpheme is not one, so skip the group lookup altogether
+            return surface
+
+        # Get synonym group for each taigen or yougen.
+        # Only when there is one synonym group ID. If there are multiple, we cannot determine.
+        # Most morphemes have none, so this is checked before the taigen matcher.
+        synonym_group_ids = morpheme.synonym_group_ids()
+        if len(synonym_group_ids) != 1:
+            return surface
+        # The parts of speech are exclusive, so a morpheme that is not a yougen to normalize must be a taigen
+        if not is_yougen and not self._taigen_matcher(morpheme):
+            return surface
+        synonym_group_id = synonym_group_ids[0]
+        synonym_group = (self.yougen_synonyms if is_yougen else self.taigen_synonyms)[synonym_group_id]
+        # The word is already the representative of its group. Whatever the flags, the narrowing below can only
+        # keep it first, so the result is the surface itself.
+        if not synonym_group or synonym_group[0].lemma == surface:
+            return surface
+        # Resolve the word's own entry once; every check below reads its fields
+        lemma_indices = self._yougen_lemma_indices if is_yougen else self._taigen_lemma_indices
+        synonym = lemma_indices[synonym_group_id].get(surface)
+        if synonym is None:
+            return surface
 
         # Change subsequent processing according to the expansion control flag
-        if flg_input.expansion == Expansion.ANY:
-            if not self._is_input_word_expansion_any_or_from_another(morpheme, synonym_group):
-                return morpheme.surface()
-        elif flg_input.expansion == Expansion.FROM_ANOTHER:
-            if not self.is_input_word_expansion_from_another(morpheme, synonym_group):
-                return morpheme.surface()
+        if flg_input.expansion is _EXPANSION_ANY:
+            if synonym.flg_expansion not in _FLG_EXPANSION_ANY_OR_FROM_ANOTHER:
+                return surface
+        elif flg_input.expansion is _EXPANSION_FROM_ANOTHER:
+            if synonym.flg_expansion != _FLG_EXPANSION_ANY:
+                return surface
         else:
-            return morpheme.surface()
+            return surface
 
         # Narrow down the synonym group to the same lexeme
-        if (
-            flg_input.other_language == OtherLanguage.ENABLE
-            or flg_input.alias == Alias.ENABLE
-            or flg_input.old_name == OldName.ENABLE
-            or flg_input.misuse == Misuse.ENABLE
-        ):
-            synonym_group = self._get_represent_synonym_group_lexeme_id(flg_input, morpheme, synonym_group)
-        if not synonym_group:
-            return morpheme.surface()
-
-        # Get the synonym group with the same word form
-        if (
-            flg_input.alphabetic_abbreviation == AlphabeticAbbreviation.ENABLE
-            or flg_input.non_alphabetic_abbreviation == NonAlphabeticAbbreviation.ENABLE
-            or flg_input.alphabet == Alphabet.ENABLE
-            or flg_input.orthographic_variation == OrthographicVariation.ENABLE
-            or flg_input.misspelling == Misspelling.ENABLE
-        ):
-            synonym_group = self._get_represent_synonym_group_by_same_word_form(flg_input, morpheme, synonym_group)
-
-        if not synonym_group:
-            return morpheme.surface()
-
-        # Get the synonym group with the same abbreviation
-        if (
-            flg_input.alphabet == Alphabet.ENABLE
-            or flg_input.orthographic_variation == OrthographicVariation.ENABLE
-            or flg_input.misspelling == Misspelling.ENABLE
-        ):
-            synonym_group = self.get_represent_synonym_group_by_same_abbreviation(flg_input, morpheme, synonym_group)
-        if not synonym_group:
-            return morpheme.surface()
-
-        # Obtain the representative notation from the synonym group. Narrow down according to the expansion control flag
-        represent_synonym = synonym_group[0]
-        if represent_synonym:
-            return represent_synonym.lemma
-        return morpheme.surface()
-
-    def _is_input_word_expansion_any_or_from_another(self, morpheme: Morpheme, synonym_group: List[Synonym]) -> bool:
-        """
-        Judge whether the input word is expanded by synonyms（入力単語が同義語展開されるかどうかを判断する）
-
-        Args:
-            morpheme: Morpheme information（形態素情報）
-            synonym_group: Synonym group（同義語グループ）
-
-        Returns:
-            True if the input word is expanded by synonyms, False otherwise（同義語展開される場合はTrue, されない場合はFalse）
-
-        Example:
-            is_expansion = _is_input_word_expansion_any_or_from_another(morpheme, synonym_group)
-        """
-        flg_expansion = self.get_synonym_value_from_morpheme(morpheme, synonym_group, SynonymField.FLG_EXPANSION)
-        if flg_expansion in (FlgExpantion.ANY.value, FlgExpantion.FROM_ANOTHER.value):
-            return True
-        return False
+        if synonym.word_form not in derived_flags.unifiable_word_forms:
+            return surface
+        representative_key = (synonym.lexeme_id,)
+        # Narrow down the synonym group to the same word form
+        if mask & (MASK_ABBREVIATION | MASK_SPELLING_INCONSISTENCY):
+            if synonym.abbreviation not in derived_flags.unifiable_abbreviations:
+                return surface
+            if flg_input.unify_level is not _UNIFY_LEVEL_LEXEME:
+                representative_key = (synonym.lexeme_id, synonym.word_form)
+        # Narrow down the synonym group to the same abbreviation
+        if mask & MASK_SPELLING_INCONSISTENCY:
+            if synonym.spelling_inconsistency not in derived_flags.unifiable_spelling_inconsistencies:
+                return surface
+            if flg_input.unify_level is _UNIFY_LEVEL_ABBREVIATION:
+                representative_key = (synonym.lexeme_id, synonym.word_form, synonym.abbreviation)
+
+        # Obtain the representative notation of the narrowed synonym group, which contains the word itself
+        representatives = self._yougen_representatives if is_yougen else self._taigen_representatives
+        return representatives[synonym_group_id][representative_key]
 
     def is_input_word_expansion_from_another(self, morpheme: Morpheme, synonym_group: List[Synonym]) -> bool:
         """
@@ -314,79 +603,6 @@ class SynonymNormalizer:
             return True
         return False
 
-    def _get_represent_synonym_group_lexeme_id(
-        self, flg_input: FlgInput, morpheme: Morpheme, synonym_group: List[Synonym]
-    ) -> List[Synonym]:
-        """
-        Get the synonym group of the same lexeme id（同じ語彙素IDの同義語グループを取得）
-
-        Args:
-            morpheme: Morpheme information（形態素情報）
-            synonym_group: Synonym group（同義語グループ）
-
-        Returns:
-            Synonym object list（Synonymオブジェクトのリスト）
-
-        Example:
-            synonym_group = _get_represent_synonym_group_lexeme_id(flg_input, morpheme, synonym_group)
-        """
-        is_expansion = False
-        filtered_synonym_group = []
-        lexeme_id = self.get_synonym_value_from_morpheme(morpheme, synonym_group, SynonymField.LEXEME_ID)
-        word_form = self.get_synonym_value_from_morpheme(morpheme, synonym_group, SynonymField.WORD_FORM)
-        if word_form == WordForm.REPRESENTATIVE.value:
-            is_expansion = True
-        elif flg_input.other_language == OtherLanguage.ENABLE and word_form == WordForm.TRANSLATION.value:
-            is_expansion = True
-        elif flg_input.alias == Alias.ENABLE and word_form == WordForm.ALIAS.value:
-            is_expansion = True
-        elif flg_input.old_name == OldName.ENABLE and word_form == WordForm.OLD_NAME.value:
-            is_expansion = True
-        elif flg_input.misuse == Misuse.ENABLE and word_form == WordForm.MISUSE.value:
-            is_expansion = True
-        if is_expansion:
-            filtered_synonym_group = [s for s in synonym_group if s.lexeme_id == lexeme_id]
-        return filtered_synonym_group
-
-    def _get_represent_synonym_group_by_same_word_form(
-        self, flg_input: FlgInput, morpheme: Morpheme, synonym_group: List[Synonym]
-    ) -> List[Synonym]:
-        """
-        Get the synonym group of the same word form（同じ語形の同義語グループを取得）
-
-        Args:
-            morpheme: Morpheme information（形態素情報）
-            synonym_group: Synonym group（同義語グループ）
-
-        Returns:
-            Synonym object list（Synonymオブジェクトのリスト）
-
-        Example:
-            synonym_group = _get_represent_synonym_group_by_same_word_form(flg_input, morpheme, synonym_group)
-        """
-        is_expansion = False
-        filtered_synonym_group = []
-        word_form = self.get_synonym_value_from_morpheme(morpheme, synonym_group, SynonymField.WORD_FORM)
-        abbreviation = self.get_synonym_value_from_morpheme(morpheme, synonym_group, SynonymField.ABBREVIATION)
-        if abbreviation == Abbreviation.REPRESENTATIVE.value:
-            is_expansion = True
-        elif (
-            flg_input.alphabetic_abbreviation == AlphabeticAbbreviation.ENABLE
-            and abbreviation == Abbreviation.ALPHABET.value
-        ):
-            is_expansion = True
-        elif (
-            flg_input.non_alphabetic_abbreviation == NonAlphabeticAbbreviation.ENABLE
-            and abbreviation == Abbreviation.NOT_ALPHABET.value
-        ):
-            is_expansion = True
-        if is_expansion:
-            if flg_input.unify_level == UnifyLevel.LEXEME:
-                return synonym_group
-            elif flg_input.unify_level in (UnifyLevel.WORD_FORM, UnifyLevel.ABBREVIATION):
-                filtered_synonym_group = [s for s in synonym_group if s.word_form == word_form]
-        return filtered_synonym_group
-
     def get_represent_synonym_group_by_same_abbreviation(
         self, flg_input: FlgInput, morpheme: Morpheme, synonym_group: List[Synonym]
     ) -> List[Synonym]:
@@ -430,12 +646,13 @@ class SynonymNormalizer:
                 filtered_synonym_group = [s for s in synonym_group if s.abbreviation == abbreviation]
         return filtered_synonym_group
 
-    def _normalize_word_by_custom_synonyms(self, word: str) -> Optional[str]:
+    def _normalize_word_by_custom_synonyms(self, word: str, unicode_normalize: bool = False) -> Optional[str]:
         """
         Normalize a word by custom synonyms（カスタム同義語で単語を正規化する）
 
         Args:
             word: Word to normalize（正規化する単語）
+            unicode_normalize: Whether the word comes from NFKC-normalized text（NFKC正規化したテキストの単語かどうか）
 
         Returns:
             Normalized word（正規化された単語）
@@ -443,10 +660,19 @@ class SynonymNormalizer:
         Example:
             normalized_word = _normalize_word_by_custom_synonyms(word)
         """
-        for k, v in self.custom_synonyms.items():
-            if word in v:
-                return k
-        return None
+        return self._get_custom_synonym_index(unicode_normalize).get(word)
+
+    def _get_custom_synonym_index(self, unicode_normalize: bool) -> Dict[str, str]:
+        """
+        Get the reverse index of custom synonyms to match（照合するカスタム同義語の逆引き索引を取得する）
+
+        Args:
+            unicode_normalize: Whether the text to match is NFKC-normalized（照合するテキストがNFKC正規化済みかどうか）
+
+        Returns:
+            Mapping from each custom synonym to its representative word（カスタム同義語から代表語への対応）
+        """
+        return self._nfkc_custom_synonym_index if unicode_normalize else self._custom_synonym_index
 
     def get_custom_synonym(self, morpheme: Morpheme) -> Optional[str]:
         """
@@ -466,7 +692,7 @@ class SynonymNormalizer:
             return custom_representation
         return None
 
-    def get_morphemes(self, text: str) -> List[str]:
+    def get_morphemes(self, text: str) -> MorphemeList:
         """
         Get morphemes from text（テキストから形態素を取得）
 
@@ -474,10 +700,83 @@ class SynonymNormalizer:
             text: Text to tokenize（トークン化するテキスト）
 
         Returns:
-            Morphemes（形態素）
+            Morphemes, supporting iteration, len() and indexing（形態素。反復・len()・インデックス参照が可能）
+        """
+        return self._get_tokenizer().tokenize(text, self.mode)
+
+    @property
+    def tokenizer_obj(self) -> tokenizer.Tokenizer:
+        """
+        Sudachi tokenizer of the current thread（現在のスレッドのSudachiトークナイザー）
+        """
+        return self._get_tokenizer()
+
+    @property
+    def taigen_matcher(self):
+        """
+        Part-of-speech matcher of taigen（体言の品詞マッチャー）
+        """
+        self._ensure_sudachi()
+        return self._taigen_matcher
+
+    @property
+    def yougen_matcher(self):
+        """
+        Part-of-speech matcher of yougen（用言の品詞マッチャー）
+        """
+        self._ensure_sudachi()
+        return self._yougen_matcher
+
+    def _ensure_sudachi(self) -> dictionary.Dictionary:
+        """
+        Initialize the Sudachi dictionary and part-of-speech matchers on first use（初回使用時にSudachi辞書と品詞マッチャーを初期化）
+
+        Returns:
+            Sudachi dictionary（Sudachi辞書）
+        """
+        sudachi_dic = self._sudachi_dic
+        if sudachi_dic is None:
+            with self._sudachi_lock:
+                if self._sudachi_dic is None:
+                    sudachi_dic = self._get_sudachi_dictionary(self._sudachi_dict)
+                    # Part-of-speech matching
+                    self._taigen_matcher = sudachi_dic.pos_matcher(lambda x: x[0] == "名詞")
+                    self._yougen_matcher = sudachi_dic.pos_matcher(lambda x: x[0] in ["動詞", "形容詞"])
+                    # Set last, so that other threads only see a fully initialized state
+                    self._sudachi_dic = sudachi_dic
+                sudachi_dic = self._sudachi_dic
+        return sudachi_dic
+
+    @classmethod
+    def _get_sudachi_dictionary(cls, sudachi_dict: str) -> dictionary.Dictionary:
+        """
+        Get the shared Sudachi dictionary of the given type, loading it on first use（指定した種類の共有Sudachi辞書を取得。初回のみ読み込む）
+
+        Args:
+            sudachi_dict: SudachiDict type（SudachiDictの種類）
+
+        Returns:
+            Sudachi dictionary（Sudachi辞書）
+        """
+        with cls._sudachi_dictionaries_lock:
+            sudachi_dic = cls._sudachi_dictionaries.get(sudachi_dict)
+            if sudachi_dic is None:
+                sudachi_dic = dictionary.Dictionary(dict=sudachi_dict)
+                cls._sudachi_dictionaries[sudachi_dict] = sudachi_dic
+        return sudachi_dic
+
+    def _get_tokenizer(self) -> tokenizer.Tokenizer:
         """
-        tokens = self.tokenizer_obj.tokenize(text, self.mode)
-        return [token for token in tokens]
+        Get the Sudachi tokenizer of the current thread（現在のスレッドのSudachiトークナイザーを取得）
+
+        Returns:
+            Tokenizer（トークナイザー）
+        """
+        tokenizer_obj = getattr(self._thread_local, "tokenizer_obj", None)
+        if tokenizer_obj is None:
+            tokenizer_obj = self._ensure_sudachi().create()
+            self._thread_local.tokenizer_obj = tokenizer_obj
+        return tokenizer_obj
 
     def get_synonym_group(self, morpheme: Morpheme, is_yougen: bool, is_taigen: bool) -> Optional[List[Synonym]]:
         """
@@ -485,23 +784,48 @@ class SynonymNormalizer:
 
         Args:
             morpheme: Morpheme information（形態素情報）
+            is_yougen: Whether to get the yougen entries of the group（用言の同義語を取得するかどうか）
+            is_taigen: Whether to get the taigen entries of the group（体言の同義語を取得するかどうか）
 
         Returns:
             Synonym group（同義語グループ）
 
         Example:
-            synonym_group = get_synonym_group(morpheme)
+            synonym_group = get_synonym_group(morpheme, is_yougen=False, is_taigen=True)
         """
 
         synonym_group_ids = morpheme.synonym_group_ids()
         if synonym_group_ids:
             # Only when there is one synonym group ID. If there are multiple, we cannot determine, so return None. If there is no ID, also return None.
             if len(synonym_group_ids) == 1:
-                synonym_group = self.synonyms[synonym_group_ids[0]]
                 if is_yougen:
-                    return [s for s in synonym_group if s.taigen_or_yougen == TaigenOrYougen.YOUGEN.value]
+                    return self.yougen_synonyms[synonym_group_ids[0]]
                 if is_taigen:
-                    return [s for s in synonym_group if s.taigen_or_yougen == TaigenOrYougen.TAIGEN.value]
+                    return self.taigen_synonyms[synonym_group_ids[0]]
+        return None
+
+    def get_synonym_entry(self, morpheme: Morpheme, is_yougen: bool, is_taigen: bool) -> Optional[Synonym]:
+        """
+        Get the synonym entry of the morpheme in its synonym group（同義語グループ内の形態素の同義語エントリを取得）
+
+        Args:
+            morpheme: Morpheme information（形態素情報）
+            is_yougen: Whether to look up the yougen entries of the group（用言の同義語から取得するかどうか）
+            is_taigen: Whether to look up the taigen entries of the group（体言の同義語から取得するかどうか）
+
+        Returns:
+            First synonym whose lemma is the surface of the morpheme, or None（表層形と同じ見出し語を持つ最初の同義語。ない場合はNone）
+
+        Example:
+            synonym = get_synonym_entry(morpheme, is_yougen=False, is_taigen=True)
+        """
+        synonym_group_ids = morpheme.synonym_group_ids()
+        # As in get_synonym_group, only a morpheme in exactly one synonym group has an entry
+        if len(synonym_group_ids) == 1:
+            if is_yougen:
+                return self._yougen_lemma_indices[synonym_group_ids[0]].get(morpheme.surface())
+            if is_taigen:
+                return self._taigen_lemma_indices[synonym_group_ids[0]].get(morpheme.surface())
         return None
 
     def get_synonym_value_from_morpheme(
@@ -510,3 +834,96 @@ class SynonymNormalizer:
         return next(
             (getattr(item, synonym_attr.value) for item in synonym_group if item.lemma == morpheme.surface()), None
         )
+
+    @staticmethod
+    def _build_custom_synonym_trie(custom_synonym_index: Dict[str, str]) -> Dict:
+        """
+        Build a character trie of custom synonyms（カスタム同義語の文字トライを構築する）
+
+        Args:
+            custom_synonym_index: Mapping from each custom synonym to its representative word（カスタム同義語から代表語への対応）
+
+        Returns:
+            Nested dicts keyed by character, with the representative word under _TRIE_END where a custom synonym ends
+            （文字をキーとする入れ子の辞書。カスタム同義語の終端では_TRIE_ENDに代表語を持つ）
+        """
+        trie: Dict = {}
+        for word, representative in custom_synonym_index.items():
+            if not word:
+                continue
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[_TRIE_END] = representative
+        return trie
+
+    @staticmethod
+    def _build_representative_lemmas(synonym_group: List[Synonym]) -> Dict[Tuple[int, ...], str]:
+        """
+        Get the representative lemma of each part of a synonym group（同義語グループの各部分の代表見出し語を取得する）
+
+        Args:
+            synonym_group: Synonym group（同義語グループ）
+
+        Returns:
+            Lemma of the first synonym keyed by (lexeme_id,), (lexeme_id, word_form) and
+            (lexeme_id, word_form, abbreviation)（(lexeme_id,)・(lexeme_id, word_form)・(lexeme_id, word_form, abbreviation)
+            ごとの最初の同義語の見出し語）
+        """
+        representatives: Dict[Tuple[int, ...], str] = {}
+        for synonym in synonym_group:
+            lexeme_id, word_form, lemma = synonym.lexeme_id, synonym.word_form, synonym.lemma
+            representatives.setdefault((lexeme_id,), lemma)
+            representatives.setdefault((lexeme_id, word_form), lemma)
+            representatives.setdefault((lexeme_id, word_form, synonym.abbreviation), lemma)
+        return representatives
+
+    @staticmethod
+    def _build_lemma_index(synonym_group: List[Synonym]) -> Dict[str, Synonym]:
+        """
+        Index a synonym group by lemma（同義語グループを見出し語で索引する）
+
+        Args:
+            synonym_group: Synonym group（同義語グループ）
+
+        Returns:
+            Mapping from lemma to the first Synonym with that lemma（見出し語から、その見出し語を持つ最初のSynonymへの対応）
+        """
+        lemma_index = {}
+        for synonym in synonym_group:
+            # Keep the first entry, as the linear scan in get_synonym_value_from_morpheme does
+            lemma_index.setdefault(synonym.lemma, synonym)
+        return lemma_index
+
+
+# Normalizer of a worker process of normalize_batch(use_processes=True)
+_process_normalizer: Optional[SynonymNormalizer] = None
+
+
+def _init_process_normalizer(
+    synonym_file_path: str, sudachi_dict: SudachiDictType, custom_synonyms_file: Optional[str]
+) -> None:
+    """
+    Build the normalizer of a worker process.
+
+    Args:
+        synonym_file_path: Path to the SudachiDict synonym file
+        sudachi_dict: SudachiDict type
+        custom_synonyms_file: Path to the custom synonym definition file
+    """
+    global _process_normalizer
+    _process_normalizer = SynonymNormalizer(synonym_file_path, sudachi_dict, custom_synonyms_file)
+
+
+def _normalize_in_process(text: str, config: Optional[NormalizerConfig]) -> str:
+    """
+    Normalize text with the normalizer of the worker process.
+
+    Args:
+        text: Text to normalize
+        config: Normalization options
+
+    Returns:
+        Normalized text
+    """
+    return _process_normalizer.normalize(text, config)